@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import os
 import sys
 import time
 from Game import *
@@ -93,8 +94,13 @@ def find():
     minWords = int(input("Must require at least n words: ").strip())
     maxWords = int(input("Must require at most n words: ").strip())
     minDiff = int(input("Must require at least n choices: ").strip())
+    checkpointFile = input("checkpoint file (blank for none): ").strip() or None
+    resume = 0
+    if checkpointFile and os.path.exists(checkpointFile):
+        resume = input(f"resume from {checkpointFile} (y/n)? ").strip() == "y"
     dictionary = WordChainDict()
-    puzzles = Solver.findPuzzles(dictionary, firstWord, lowWordLen, highWordLen, minWords, maxWords, minDiff)
+    puzzles = Solver.findPuzzles(dictionary, firstWord, lowWordLen, highWordLen, minWords, maxWords, minDiff,
+                                 checkpointFile=checkpointFile, resume=resume)
     print ('I found these puzzles:\n')
     for puzzle in puzzles:
         print (puzzle, "difficulty: ", puzzle.difficulty(dictionary))
@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+
+import os
+import sys
+import time
+from collections import deque
+from Resources import *
+from Solver import *
+
+"""
+Report which daily games a dictionary change affects: a different solution, a different
+number of steps, or a different difficulty.  Exits with status 1 if any game changed, so it
+can gate dictionary commits.  From this directory:
+
+git show HEAD:docs/resources/WordChainDict > /tmp/OldDict
+./DailyGameImpact.py /tmp/OldDict ../docs/resources/WordChainDict ../docs/resources/DailyGames ../docs/resources/DailySolutions
+
+Rather than re-solving every game, distances from the added and removed words are found with
+one breadth-first search outward from them over the union of both dictionaries.  A game whose
+solution takes L steps can only change if some changed word w lies on a path of at most L
+steps from start to target, which requires dist(start) + dist(target) <= L.  Its difficulty can
+only change if a changed word is one step from a word on the solution.
+
+The old solutions come from the solutions file, docs/resources/DailySolutions, which is
+committed next to DailyGames.  It starts with a hash of the dictionary it was solved with,
+and the tool fails if that is not the old dictionary: without it every game would have to be
+solved again, which takes tens of minutes.  Games missing from the file (e.g. newly added
+daily games) are solved with the old dictionary.  Each run rewrites the file for the new
+dictionary, so commit it along with the dictionary change.
+
+To build the file from scratch (slow), pass --rebuild; the old dictionary's solutions are
+then all solved:
+
+./DailyGameImpact.py --rebuild ../docs/resources/WordChainDict ../docs/resources/WordChainDict ../docs/resources/DailyGames ../docs/resources/DailySolutions
+"""
+
+class GameResult():
+    # The parts of a daily game that players see: solution, steps, and difficulty.
+
+    def __init__(self, wordList, difficulty):
+        # an empty wordList means there is no solution
+        self.wordList = wordList
+        self.difficulty = difficulty
+
+    def solve(dictionary, start, end):
+        solution = Solver.solve(dictionary, start, end)
+        if not solution.isSolved():
+            return GameResult([], 0)
+        return GameResult(solution.getWordList(), solution.difficulty(dictionary))
+
+    def withDifficulty(self, dictionary):
+        if not self.isSolved():
+            return self
+        solution = PartialSolution(self.wordList[0], self.wordList[-1])
+        for word in self.wordList[1:]:
+            solution.addWord(word)
+        return GameResult(self.wordList, solution.difficulty(dictionary))
+
+    def isSolved(self):
+        return len(self.wordList) > 0
+
+    def numSteps(self):
+        return len(self.wordList) - 1
+
+    def differences(self, other):
+        differences = []
+        if self.wordList != other.wordList:
+            differences.append("solution")
+        if self.numSteps() != other.numSteps():
+            differences.append("steps")
+        if self.difficulty != other.difficulty:
+            differences.append("difficulty")
+        return differences
+
+    def __str__(self):
+        if not self.isSolved():
+            return "no solution"
+        return "{} [{} steps, difficulty {}]".format(",".join(self.wordList), self.numSteps(), self.difficulty)
+
+
+def readSolutions(solutionsFileName, dictHash):
+    # Returns the cached results, or None if the file was not written for this dictionary.
+    with open(solutionsFileName, "r") as solutionsFile:
+        lines = [line.strip() for line in solutionsFile]
+    if not lines or lines[0] != f"# {dictHash}":
+        return None
+    results = {}
+    for line in lines[1:]:
+        start, end, words, difficulty = line.split(" ")
+        results[(start, end)] = GameResult(words.split(",") if words != "-" else [], int(difficulty))
+    return results
+
+
+def writeSolutions(solutionsFileName, results, dictHash):
+    with open(solutionsFileName, "w") as solutionsFile:
+        solutionsFile.write(f"# {dictHash}\n")
+        for (start, end), result in results.items():
+            words = ",".join(result.wordList) if result.isSolved() else "-"
+            solutionsFile.write(f"{start} {end} {words} {result.difficulty}\n")
+
+
+def distancesFromChanges(changedWords, unionDictionary, maxDistance):
+    # Breadth-first search outward from every changed word at once.
+    distances = {word: 0 for word in changedWords}
+    frontier = deque(changedWords)
+    while frontier:
+        word = frontier.popleft()
+        distance = distances[word]
+        if distance >= maxDistance:
+            continue
+        for nextWord in unionDictionary.findNextWords(word):
+            if nextWord not in distances:
+                distances[nextWord] = distance + 1
+                frontier.append(nextWord)
+    return distances
+
+
+def findImpact(oldDictionary, newDictionary, games, oldResults):
+    """
+    oldResults maps (start, end) to the GameResult with the old dictionary; games missing from
+    it are solved first.
+    Returns (newResults, changes, numResolved) where changes lists
+    (gameNumber, start, end, differences, oldResult, newResult) for every changed game.
+    """
+    oldWords = oldDictionary.getWordSet()
+    newWords = newDictionary.getWordSet()
+    changedWords = sorted((newWords - oldWords) | (oldWords - newWords))
+
+    for game in games:
+        if game not in oldResults:
+            oldResults[game] = GameResult.solve(oldDictionary, *game)
+
+    solvedSteps = [result.numSteps() for result in oldResults.values() if result.isSolved()]
+    if len(solvedSteps) < len(oldResults):
+        # a game without a solution could become solvable through any reachable change
+        maxDistance = len(oldWords | newWords)
+    else:
+        maxDistance = max(solvedSteps, default=0)
+    unionDictionary = WordChainDict(list(oldWords | newWords))
+    distances = distancesFromChanges(changedWords, unionDictionary, maxDistance)
+    unreached = maxDistance + 1
+
+    newResults = {}
+    changes = []
+    numResolved = 0
+    for gameNumber, (start, end) in enumerate(games, 1):
+        oldResult = oldResults[(start, end)]
+        limit = oldResult.numSteps() if oldResult.isSolved() else maxDistance
+        if distances.get(start, unreached) + distances.get(end, unreached) <= limit:
+            newResult = GameResult.solve(newDictionary, start, end)
+            numResolved += 1
+        elif any(distances.get(word, unreached) <= 1 for word in oldResult.wordList[:-1]):
+            newResult = oldResult.withDifficulty(newDictionary)
+        else:
+            newResult = oldResult
+        newResults[(start, end)] = newResult
+        differences = oldResult.differences(newResult)
+        if differences:
+            changes.append((gameNumber, start, end, differences, oldResult, newResult))
+
+    return newResults, changes, numResolved
+
+
+def main():
+    args = sys.argv[1:]
+    rebuild = "--rebuild" in args
+    if rebuild:
+        args.remove("--rebuild")
+    if len(args) != 4:
+        print("USAGE: DailyGameImpact.py [--rebuild] oldDictFile newDictFile dailyGamesFile solutionsFile")
+        sys.exit(2)
+
+    oldDictionary = loadDictionary(args[0])
+    newDictionary = loadDictionary(args[1])
+    games = loadDailyGames(args[2])
+    solutionsFileName = args[3]
+
+    startTime = time.time()
+    if rebuild:
+        oldResults = {}
+    else:
+        if not os.path.exists(solutionsFileName):
+            print(f"{solutionsFileName} does not exist; build it with --rebuild")
+            sys.exit(2)
+        oldResults = readSolutions(solutionsFileName, dictionaryHash(oldDictionary))
+        if oldResults is None:
+            print(f"{solutionsFileName} was not written for {args[0]}; build it with --rebuild")
+            sys.exit(2)
+    numMissing = len([game for game in games if game not in oldResults])
+    if numMissing:
+        print(f"solving {numMissing} games with the old dictionary")
+
+    newResults, changes, numResolved = findImpact(oldDictionary, newDictionary, games, oldResults)
+
+    writeSolutions(solutionsFileName, newResults, dictionaryHash(newDictionary))
+
+    for gameNumber, start, end, differences, oldResult, newResult in changes:
+        print(f"game {gameNumber} {start},{end}: {', '.join(differences)} changed")
+        print(f"    old: {oldResult}")
+        print(f"    new: {newResult}")
+    print(f"{len(changes)} of {len(games)} games changed; re-solved {numResolved} "
+          f"in {time.time() - startTime:.2f} seconds")
+    sys.exit(1 if changes else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+
+import json
+import sys
+from WordChainDict import *
+
+"""
+Precomputed picker masks for "easier mode".  For every word in a dictionary:
+
+- replacement masks: per position, a 26-bit mask of letters that can replace the letter there
+  and still form a word (bit 0 is 'a').
+- insert letter masks: per gap 0..len(word), the letters that can be inserted there.
+- insert position mask: bit i set if at least one letter can be inserted at gap i.
+- delete position mask: bit i set if deleting the letter at position i leaves a word.
+
+To export the table for the client, from this directory:
+
+./LetterMasks.py ../docs/resources/WordChainDict LetterMasks.json
+"""
+
+class LetterMasks():
+
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        # for WordChainDict this is the dictionary's own set, so it follows add() and remove()
+        self.wordSet = dictionary.getWordSet()
+        self.table = {}
+
+        # The one pass over the dictionary: file each word's letter under every wildcard
+        # pattern it matches, e.g. 'cat' sets bit 'c' of '?at', 'a' of 'c?t' and 't' of 'ca?'.
+        # A word's replacement letters at i are the letters of its own pattern at i, and
+        # the letters that can be inserted at gap i are those of the pattern that puts a
+        # wildcard there.  The patterns are kept so the table can be updated incrementally.
+        self.patternMasks = {}
+        for word in self.wordSet:
+            for position, letter in enumerate(word):
+                pattern = word[:position] + '?' + word[position+1:]
+                self.patternMasks[pattern] = self.patternMasks.get(pattern, 0) | LetterMasks.bit(letter)
+
+        # Each word's entry is then just lookups in patternMasks and the word set.
+        for word in self.wordSet:
+            self.table[word] = self.computeEntry(word)
+
+    def computeEntry(self, word):
+        replaceMasks = tuple(self.patternMasks.get(word[:i] + '?' + word[i+1:], 0) & ~LetterMasks.bit(word[i])
+                             for i in range(len(word)))
+        insertMasks = tuple(self.patternMasks.get(word[:i] + '?' + word[i:], 0) for i in range(len(word)+1))
+        insertPositions = 0
+        for i, mask in enumerate(insertMasks):
+            if mask:
+                insertPositions |= 1 << i
+        deletePositions = 0
+        for i in range(len(word)):
+            if word[:i] + word[i+1:] in self.wordSet:
+                deletePositions |= 1 << i
+        return (replaceMasks, insertMasks, insertPositions, deletePositions)
+
+    # Dictionary listener methods (see WordChainDict.addListener()).  Only the entries of
+    # the changed word and its one-step neighbors are recomputed.
+
+    def wordAdded(self, word):
+        for position, letter in enumerate(word):
+            pattern = word[:position] + '?' + word[position+1:]
+            self.patternMasks[pattern] = self.patternMasks.get(pattern, 0) | LetterMasks.bit(letter)
+        self.wordSet.add(word)
+        self.updateNeighbors(word)
+
+    def wordRemoved(self, word):
+        for position, letter in enumerate(word):
+            pattern = word[:position] + '?' + word[position+1:]
+            # pattern plus letter identifies exactly one word, so the bit can simply be cleared
+            mask = self.patternMasks.get(pattern, 0) & ~LetterMasks.bit(letter)
+            if mask:
+                self.patternMasks[pattern] = mask
+            else:
+                self.patternMasks.pop(pattern, None)
+        self.wordSet.discard(word)
+        self.table.pop(word, None)
+        self.updateNeighbors(word)
+
+    def updateNeighbors(self, word):
+        affected = set()
+        # same length words differing at one position, and the shorter word missing that position
+        for position in range(len(word)):
+            pattern = word[:position] + '?' + word[position+1:]
+            affected.update(self.wordsMatching(pattern))
+            affected.add(word[:position] + word[position+1:])
+        # longer words that have word with one letter deleted
+        for position in range(len(word)+1):
+            affected.update(self.wordsMatching(word[:position] + '?' + word[position:]))
+        affected.add(word)
+
+        for affectedWord in affected:
+            if affectedWord in self.wordSet:
+                self.table[affectedWord] = self.computeEntry(affectedWord)
+
+    def wordsMatching(self, pattern):
+        mask = self.patternMasks.get(pattern, 0)
+        return [pattern.replace('?', letter) for letter in LetterMasks.lettersInMask(mask)]
+
+    def bit(letter):
+        return 1 << (ord(letter) - ord('a'))
+
+    def lettersInMask(mask):
+        return [letter for letter in WordChainDict.Letters if mask & LetterMasks.bit(letter)]
+
+    # All of the queries below return 0 for a word that is not in the table.
+
+    def replacementMask(self, word, position):
+        entry = self.table.get(word)
+        return entry[0][position] if entry else 0
+
+    def insertLetterMask(self, word, position):
+        entry = self.table.get(word)
+        return entry[1][position] if entry else 0
+
+    def insertPositionMask(self, word):
+        entry = self.table.get(word)
+        return entry[2] if entry else 0
+
+    def deletePositionMask(self, word):
+        entry = self.table.get(word)
+        return entry[3] if entry else 0
+
+    def isValidReplacement(self, word, position, letter):
+        return (self.replacementMask(word, position) & LetterMasks.bit(letter)) != 0
+
+    def canInsertAt(self, word, position):
+        return (self.insertPositionMask(word) >> position) & 1 == 1
+
+    def canDeleteAt(self, word, position):
+        return (self.deletePositionMask(word) >> position) & 1 == 1
+
+    def getSize(self):
+        return len(self.table)
+
+    def export(self, outFileName):
+        # word -> [replacement masks, insert letter masks, insert position mask, delete position mask]
+        exported = {word: [list(entry[0]), list(entry[1]), entry[2], entry[3]]
+                    for word, entry in sorted(self.table.items())}
+        with open(outFileName, "w") as outFile:
+            json.dump(exported, outFile, separators=(',', ':'))
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("USAGE: LetterMasks.py dictFile outFile")
+        sys.exit(1)
+
+    with open(sys.argv[1], "r") as dictFile:
+        dictionary = WordChainDict([line.strip() for line in dictFile])
+    letterMasks = LetterMasks(dictionary)
+    letterMasks.export(sys.argv[2])
+    print("exported masks for {} words".format(letterMasks.getSize()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from Game import *
+from Resources import *
+
+"""
+Replay scripted Game sessions concurrently and report throughput and latency.
+
+Every worker process loads one dictionary, freezes it, and shares it read-only between
+its threads.  Each session is scripted from a daily game's solution: before every move
+the player asks for nextWordHint(), then plays the move with replace(), remove(), or
+insertSpace() followed by replace().  For example, from this directory:
+
+./LoadTest.py --sessions 2000 --threads 8 --processes 4
+"""
+
+# dictionary shared by all threads in a worker process
+sharedDictionary = None
+
+
+def scriptMoves(solution):
+    """
+    Turn a solution into the list of Game calls that plays it: ('replace', index, letter),
+    ('remove', index), or ('insertSpace', index) which is always followed by a replace.
+    """
+    moves = []
+    words = solution.getWordList()
+    for previousWord, nextWord in zip(words, words[1:]):
+        if len(nextWord) == len(previousWord):
+            index = [i for i in range(len(nextWord)) if nextWord[i] != previousWord[i]][0]
+            moves.append(('replace', index, nextWord[index]))
+        elif len(nextWord) < len(previousWord):
+            index = [i for i in range(len(previousWord)) if previousWord[:i] + previousWord[i+1:] == nextWord][0]
+            moves.append(('remove', index))
+        else:
+            index = [i for i in range(len(nextWord)) if nextWord[:i] + nextWord[i+1:] == previousWord][0]
+            moves.append(('insertSpace', index))
+            moves.append(('replace', index, nextWord[index]))
+    return moves
+
+
+def buildScripts(dictionary, games, numSessions):
+    scriptsByGame = []
+    for start, end in games[:numSessions]:
+        solution = Solver.solve(dictionary, start, end)
+        if solution.isSolved():
+            scriptsByGame.append((start, end, scriptMoves(solution)))
+        else:
+            print (f"skipping {start},{end}: {solution.getError()}")
+    return [scriptsByGame[i % len(scriptsByGame)] for i in range(numSessions)]
+
+
+def timed(latencies, operation, function, *args):
+    startTime = time.perf_counter_ns()
+    result = function(*args)
+    latencies.append((operation, time.perf_counter_ns() - startTime))
+    return result
+
+
+def playSession(script):
+    start, end, moves = script
+    latencies = []
+    game = timed(latencies, 'newGame', Game, sharedDictionary, start, end)
+    for move in moves:
+        timed(latencies, 'nextWordHint', game.nextWordHint)
+        result = timed(latencies, move[0], getattr(game, move[0]), *move[1:])
+        if result != Game.OK:
+            raise RuntimeError(f"{start},{end}: {move} returned {result}")
+    if not game.isSolved():
+        raise RuntimeError(f"{start},{end}: not solved after scripted moves")
+    return latencies
+
+
+def initWorker(dictFileName, useDAWG):
+    global sharedDictionary
+    sharedDictionary = loadDictionary(dictFileName, useDAWG).freeze()
+
+
+def runWorker(scripts, numThreads, startBarrier=None):
+    # Returns the latencies and the wall-clock interval this worker spent playing.  With
+    # several processes, every worker waits at startBarrier until all of them have loaded
+    # their dictionaries, so the interval covers only the sessions.
+    if startBarrier is not None:
+        startBarrier.wait()
+    latencies = []
+    startTime = time.time()
+    with ThreadPoolExecutor(max_workers=numThreads) as executor:
+        for sessionLatencies in executor.map(playSession, scripts):
+            latencies.extend(sessionLatencies)
+    return latencies, startTime, time.time()
+
+
+def percentile(sortedValues, fraction):
+    index = min(len(sortedValues) - 1, int(fraction * len(sortedValues)))
+    return sortedValues[index]
+
+
+def report(latencies, elapsedSeconds, numSessions):
+    print (f"{numSessions} sessions, {len(latencies)} calls in {elapsedSeconds:.2f} seconds")
+    # a player move is a replace or remove; the replace after insertSpace completes that move,
+    # so insertSpace itself is not counted
+    numMoves = len([latency for operation, latency in latencies if operation in ('replace', 'remove')])
+    print (f"{numMoves / elapsedSeconds:.1f} moves/second")
+    print ("{:14} {:>8} {:>10} {:>10} {:>10} {:>10}".format("call", "count", "p50 ms", "p90 ms", "p99 ms", "max ms"))
+    operations = sorted(set(operation for operation, latency in latencies))
+    for operation in operations + ['all']:
+        values = sorted(latency for op, latency in latencies if operation in (op, 'all'))
+        print ("{:14} {:>8} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}".format(operation, len(values),
+               percentile(values, 0.50) / 1e6, percentile(values, 0.90) / 1e6,
+               percentile(values, 0.99) / 1e6, values[-1] / 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay scripted Game sessions concurrently.")
+    parser.add_argument("--dict", default=os.path.join(ResourceDir, "WordChainDict"), help="dictionary file")
+    parser.add_argument("--games", default=os.path.join(ResourceDir, "DailyGames"), help="start/end word pairs")
+    parser.add_argument("--sessions", type=int, default=1000, help="number of sessions to play")
+    parser.add_argument("--threads", type=int, default=4, help="threads per process")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes")
+    parser.add_argument("--dawg", action="store_true", help="use WordChainDAWG instead of WordChainDict")
+    args = parser.parse_args()
+
+    initWorker(args.dict, args.dawg)
+    scripts = buildScripts(sharedDictionary, loadDailyGames(args.games), args.sessions)
+    if not scripts:
+        print ("no playable games")
+        sys.exit(1)
+
+    # deal the sessions out round-robin so every process gets a similar mix of games
+    shares = [scripts[i::args.processes] for i in range(args.processes)]
+
+    if args.processes == 1:
+        workerResults = [runWorker(scripts, args.threads)]
+    else:
+        with multiprocessing.Manager() as manager:
+            startBarrier = manager.Barrier(args.processes)
+            with ProcessPoolExecutor(max_workers=args.processes, initializer=initWorker,
+                                     initargs=(args.dict, args.dawg)) as executor:
+                workerResults = list(executor.map(runWorker, shares, [args.threads] * args.processes,
+                                                  [startBarrier] * args.processes))
+
+    latencies = []
+    for workerLatencies, startTime, endTime in workerResults:
+        latencies.extend(workerLatencies)
+    elapsedSeconds = max(result[2] for result in workerResults) - min(result[1] for result in workerResults)
+
+    report(latencies, elapsedSeconds, len(scripts))
+
+if __name__ == '__main__':
+    main()
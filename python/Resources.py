@@ -0,0 +1,33 @@
+import hashlib
+import os
+from WordChainDAWG import *
+
+"""
+Loading the dictionary and daily game files shared by the command-line tools.
+"""
+
+ResourceDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "docs", "resources")
+
+
+def loadDictionary(dictFileName, useDAWG=False):
+    with open(dictFileName, "r") as dictFile:
+        wordList = [line.strip() for line in dictFile]
+    if useDAWG:
+        return WordChainDAWG(wordList)
+    return WordChainDict(wordList)
+
+
+def loadDailyGames(gamesFileName):
+    # one "start target" pair per line, in daily game order
+    games = []
+    with open(gamesFileName, "r") as gamesFile:
+        for line in gamesFile:
+            words = line.split()
+            if len(words) == 2:
+                games.append((words[0], words[1]))
+    return games
+
+
+def dictionaryHash(dictionary):
+    # identifies a dictionary's contents, e.g. to tell whether saved results are still valid for it
+    return hashlib.sha1("\n".join(sorted(dictionary.getWordSet())).encode()).hexdigest()
@@ -0,0 +1,124 @@
+from Solver import *
+
+
+class SolutionCache():
+    """
+    Caches Solver.solve() results for a dictionary and drops exactly the ones a dictionary
+    change could affect.  Register it with dictionary.addListener(cache).
+
+    - Removing a word only changes solutions whose path (or start or target) contains it.
+      Removing any other word can only delay other nodes of the breadth-first search, so the
+      path's words are still claimed by the same parents in the same order.
+    - Adding a word w only changes a solution of L steps if w lies on a path of at most L
+      steps, i.e. dist(start, w) + dist(w, target) <= L.  Every step is one letter edit, so
+      the edit distance is a lower bound on dist; solutions that fail the test even with
+      edit distances are kept without searching.  For the rest, one breadth-first search from
+      w runs only until each of them is decided.  A cached
+      "no solution" result is dropped on every addition.
+    """
+
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self.solutions = {}
+        # word -> set of (fromWord, toWord) keys whose solution path contains the word
+        self.pathIndex = {}
+
+    def solve(self, fromWord, toWord):
+        key = (fromWord, toWord)
+        solution = self.solutions.get(key)
+        if solution is None:
+            solution = Solver.solve(self.dictionary, fromWord, toWord)
+            self.solutions[key] = solution
+            for word in self.pathWords(key):
+                self.pathIndex.setdefault(word, set()).add(key)
+        # hand out copies so callers cannot change the cached solution
+        return solution.copy() if solution.success() else solution
+
+    def pathWords(self, key):
+        solution = self.solutions[key]
+        words = set(key)
+        if solution.isSolved():
+            words.update(solution.getWordList())
+        return words
+
+    def invalidate(self, key):
+        if key not in self.solutions:
+            return
+        for word in self.pathWords(key):
+            keys = self.pathIndex.get(word)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.pathIndex[word]
+        del self.solutions[key]
+
+    def editDistance(word1, word2):
+        previousRow = list(range(len(word2) + 1))
+        for i, letter1 in enumerate(word1, 1):
+            row = [i]
+            for j, letter2 in enumerate(word2, 1):
+                row.append(min(previousRow[j] + 1, row[j-1] + 1, previousRow[j-1] + (letter1 != letter2)))
+            previousRow = row
+        return previousRow[-1]
+
+    def findOnShortPaths(self, word, candidates):
+        """
+        Returns the candidate keys with dist(fromWord, word) + dist(word, toWord) <= the
+        cached number of steps.  The breadth-first search from word goes one level at a time
+        and stops as soon as every candidate is decided.
+        """
+        found = []
+        distances = {word: 0}
+        level = [word]
+        depth = 0
+        while candidates:
+            undecided = []
+            for key in candidates:
+                numSteps = self.solutions[key].numSteps()
+                # words not reached yet are at least depth + 1 away
+                fromDistance = distances.get(key[0], depth + 1)
+                toDistance = distances.get(key[1], depth + 1)
+                if fromDistance + toDistance > numSteps:
+                    continue
+                if key[0] in distances and key[1] in distances:
+                    found.append(key)
+                else:
+                    undecided.append(key)
+            candidates = undecided
+            if not candidates or not level:
+                break
+            depth += 1
+            nextLevel = []
+            for levelWord in level:
+                for nextWord in self.dictionary.findNextWords(levelWord):
+                    if nextWord not in distances:
+                        distances[nextWord] = depth
+                        nextLevel.append(nextWord)
+            level = nextLevel
+        return found
+
+    # Dictionary listener methods (see WordChainDict.addListener()).  Each returns the keys
+    # it invalidated.
+
+    def wordAdded(self, word):
+        solved = [key for key, solution in self.solutions.items() if solution.isSolved()]
+        invalidated = [key for key in self.solutions if key not in solved]
+        candidates = [key for key in solved
+                      if SolutionCache.editDistance(key[0], word) + SolutionCache.editDistance(word, key[1])
+                         <= self.solutions[key].numSteps()]
+        invalidated.extend(self.findOnShortPaths(word, candidates))
+        for key in invalidated:
+            self.invalidate(key)
+        return invalidated
+
+    def wordRemoved(self, word):
+        invalidated = list(self.pathIndex.get(word, ()))
+        for key in invalidated:
+            self.invalidate(key)
+        return invalidated
+
+    def isCached(self, fromWord, toWord):
+        return (fromWord, toWord) in self.solutions
+
+    def getSize(self):
+        return len(self.solutions)
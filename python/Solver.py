@@ -1,6 +1,10 @@
 import copy
+import gzip
+import os
 import sys
+import time
 from collections import deque
+from Resources import *
 
 class Solver():
     # solve the puzzle fromWord to targetWord
@@ -73,7 +77,13 @@ class Solver():
     # favor looking at reduce/add a character next words before same length words.
     # returns a list of solutions, each as a word-lists.  
     #
-    def findPuzzles(dictionary, startWord, lowWordLen, highWordLen, minWords, maxWords, minDifficulty):
+    # If checkpointFile is given, the search state is saved there every checkpointSeconds
+    # and the file is deleted when the search finishes.  With resume=1 an existing
+    # checkpoint file is loaded and the search carries on exactly where it stopped; the
+    # checkpoint must have been written for the same parameters and dictionary.
+    #
+    def findPuzzles(dictionary, startWord, lowWordLen, highWordLen, minWords, maxWords, minDifficulty,
+                    checkpointFile=None, checkpointSeconds=60, resume=0):
 
         localDictionary = dictionary.copy()
         desiredPuzzles = list()
@@ -81,23 +91,90 @@ class Solver():
             print (startWord + " is not a word.")
             return desiredPuzzles
         # search forever until all suitable puzzles are found
-        firstPuzzle = PartialSolution(startWord, "dummy-end")
-        listOfPossiblePuzzles = deque()
-        listOfPossiblePuzzles.append(firstPuzzle)
-        while len(listOfPossiblePuzzles) > 0:
-            puzzle = listOfPossiblePuzzles.popleft()
+        parameters = [startWord, lowWordLen, highWordLen, minWords, maxWords, minDifficulty]
+        # a checkpoint is only valid for the dictionary it was searching
+        dictHash = dictionaryHash(dictionary) if checkpointFile else None
+        if resume and checkpointFile and os.path.exists(checkpointFile):
+            search = PuzzleSearch.load(checkpointFile, parameters, dictHash)
+            # every word in the search tree except the start has been claimed already
+            for word in search.words[1:]:
+                localDictionary.remove(word)
+        else:
+            search = PuzzleSearch(parameters, dictHash)
+        nextCheckpoint = time.time() + checkpointSeconds
+        while len(search.frontier) > 0:
+            if checkpointFile and time.time() >= nextCheckpoint:
+                search.save(checkpointFile)
+                nextCheckpoint = time.time() + checkpointSeconds
+            node = search.frontier.popleft()
+            puzzle = search.getPuzzle(node)
             if (Solver.isDesired(puzzle, dictionary, lowWordLen, highWordLen, minWords, maxWords, minDifficulty)):
-                desiredPuzzles.append(puzzle)
+                search.results.append(node)
             #keep looking if not too long already
             if (puzzle.numWords() < maxWords):
-                nextWords = localDictionary.findNextWords(puzzle.getLastWord())
+                # sorted so that a resumed search claims words in the same order
+                nextWords = sorted(localDictionary.findNextWords(puzzle.getLastWord()))
                 for nextWord in nextWords:
                     localDictionary.remove(nextWord)
-                    newPuzzle = puzzle.copy()
-                    newPuzzle.addWord(nextWord)
-                    listOfPossiblePuzzles.append(newPuzzle)
-        return desiredPuzzles
-        
+                    search.frontier.append(search.addWord(nextWord, node))
+        if checkpointFile and os.path.exists(checkpointFile):
+            os.remove(checkpointFile)
+        return [search.getPuzzle(node) for node in search.results]
+
+class PuzzleSearch():
+    # The state of a findPuzzles() search.  Every word is claimed at most once, so the
+    # puzzles form a tree: node i is words[i], reached from node parents[i].  The frontier
+    # and results are just node numbers, which keeps both memory and checkpoints small.
+
+    def __init__(self, parameters, dictHash):
+        self.parameters = parameters
+        self.dictHash = dictHash
+        self.words = [parameters[0]]
+        self.parents = [-1]
+        self.frontier = deque([0])
+        self.results = []
+
+    def addWord(self, word, parent):
+        self.words.append(word)
+        self.parents.append(parent)
+        return len(self.words) - 1
+
+    def getPuzzle(self, node):
+        wordList = []
+        while node >= 0:
+            wordList.append(self.words[node])
+            node = self.parents[node]
+        wordList.reverse()
+        puzzle = PartialSolution(wordList[0], "dummy-end")
+        puzzle.wordsSoFar = wordList
+        return puzzle
+
+    def save(self, checkpointFile):
+        # write a new file and then rename it, so a kill mid-write leaves the last checkpoint intact
+        tempFile = checkpointFile + ".tmp"
+        with gzip.open(tempFile, "wt") as outFile:
+            outFile.write(" ".join(str(parameter) for parameter in self.parameters) + "\n")
+            outFile.write(self.dictHash + "\n")
+            outFile.write(" ".join(self.words) + "\n")
+            outFile.write(" ".join(str(parent) for parent in self.parents) + "\n")
+            outFile.write(" ".join(str(node) for node in self.frontier) + "\n")
+            outFile.write(" ".join(str(node) for node in self.results) + "\n")
+        os.replace(tempFile, checkpointFile)
+
+    def load(checkpointFile, parameters, dictHash):
+        with gzip.open(checkpointFile, "rt") as inFile:
+            lines = [line.split() for line in inFile]
+        if lines[0] != [str(parameter) for parameter in parameters]:
+            raise RuntimeError(f"{checkpointFile} was written for a search with parameters {lines[0]}")
+        if lines[1] != [dictHash]:
+            raise RuntimeError(f"{checkpointFile} was written for a different dictionary")
+        search = PuzzleSearch(parameters, dictHash)
+        search.words = lines[2]
+        search.parents = [int(parent) for parent in lines[3]]
+        search.frontier = deque(int(node) for node in lines[4])
+        search.results = [int(node) for node in lines[5]]
+        return search
+
 class PartialSolution():
 
     def __init__(self, fromWord, targetWord):
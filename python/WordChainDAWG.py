@@ -0,0 +1,234 @@
+from WordChainDict import *
+
+
+class DAWGNode():
+    # A node in the frozen word graph.  'letters' is a string of the outgoing edge letters
+    # in alphabetical order, so that neighbors come out in the same order as WordChainDict
+    # produces them, and 'children' is the tuple of child nodes in the same order.
+    __slots__ = ('final', 'letters', 'children')
+
+    def __init__(self, final, letters, children):
+        self.final = final
+        self.letters = letters
+        self.children = children
+
+    def child(self, letter):
+        index = self.letters.find(letter)
+        return self.children[index] if index >= 0 else None
+
+    def edges(self):
+        return zip(self.letters, self.children)
+
+
+class WordChainDAWG():
+    """
+    An immutable alternative to WordChainDict.  Words are stored in a directed acyclic word
+    graph (a trie with shared suffixes) and neighbors are generated by walking only the edges
+    that actually exist, rather than probing all 26 letters at every position.
+
+    The graph itself is never modified.  Like WordChainDict, remove() is supported so that
+    Solver can destructively search a copy, but it only records the word in a per-instance
+    removed set; copy() shares the graph and just duplicates that set.  As with WordChainDict,
+    freeze() makes remove() raise, after which the instance is safe for concurrent readers.
+    """
+
+    def __init__(self, wordList=None, maxLength=None, root=None, numWords=0):
+        self.frozen = False
+        self.removed = set()
+        if root:
+            # used by copy(): share an already-built graph
+            self.root = root
+            self.numWords = numWords
+            return
+
+        if not wordList:
+            wordList = WordChainDict(maxLength=maxLength).getWordSet()
+
+        if not maxLength:
+            maxLength = 20
+
+        words = set()
+        for word in wordList:
+            word = word.lower()
+            if word and word[0] != '#' and len(word) >= 3 and len(word) <= maxLength:
+                words.add(word)
+
+        self.numWords = len(words)
+        self.root = self.build(sorted(words))
+
+    def __str__(self):
+        return str(list(self.getWordSet())[0:20])
+
+    def build(self, sortedWords):
+        # Incremental construction from sorted words: the branch the previous word added
+        # below its common prefix with the next word can never change again, so it is frozen
+        # right away, sharing any node already frozen with the same final flag and edges.
+        # Nodes under construction are [final, {letter: child}].
+        register = {}
+        root = [False, {}]
+        # (parent, letter, child) for each letter of the previous word that is not frozen yet
+        unchecked = []
+        previousWord = ""
+        for word in sortedWords:
+            common = 0
+            for letter, previousLetter in zip(word, previousWord):
+                if letter != previousLetter:
+                    break
+                common += 1
+            self.freezeUnchecked(unchecked, common, register)
+            node = unchecked[-1][2] if unchecked else root
+            for letter in word[common:]:
+                child = [False, {}]
+                node[1][letter] = child
+                unchecked.append((node, letter, child))
+                node = child
+            node[0] = True
+            previousWord = word
+        self.freezeUnchecked(unchecked, 0, register)
+        return self.freezeNode(root, register)
+
+    def freezeUnchecked(self, unchecked, downTo, register):
+        while len(unchecked) > downTo:
+            parent, letter, child = unchecked.pop()
+            parent[1][letter] = self.freezeNode(child, register)
+
+    def freezeNode(self, node, register):
+        # all of node's children are frozen already
+        final, edges = node
+        letters = "".join(edges.keys())
+        children = tuple(edges.values())
+        signature = (final, letters, tuple(map(id, children)))
+        frozen = register.get(signature)
+        if frozen is None:
+            frozen = DAWGNode(final, letters, children)
+            register[signature] = frozen
+        return frozen
+
+    def copy(self):
+        newCopy = WordChainDAWG(root=self.root, numWords=self.numWords)
+        newCopy.removed = set(self.removed)
+        return newCopy
+
+    def findNode(self, node, letters):
+        # Follow letters from node; returns None if that path is not in the graph.
+        for letter in letters:
+            node = node.child(letter)
+            if node is None:
+                return None
+        return node
+
+    def accepts(self, node, suffix):
+        node = self.findNode(node, suffix)
+        return node is not None and node.final
+
+    def findAdderWords(self, word):
+        """
+        Find all valid words that add one letter to word.
+        """
+        adders = list()
+
+        node = self.root
+        for position in range(len(word)+1):
+            suffix = word[position:]
+            for letter, child in node.edges():
+                if self.accepts(child, suffix):
+                    potentialWord = word[0:position] + letter + suffix
+                    if potentialWord not in self.removed:
+                        adders.append(potentialWord)
+            if position < len(word):
+                node = node.child(word[position])
+                if node is None:
+                    # no word starts with this prefix, so nothing can be inserted further along
+                    break
+
+        return adders
+
+    def findNextWords(self, word):
+        adders       = self.findAdderWords(word)
+        removers     = self.findRemoverWords(word)
+        replacements = self.findReplacementWords(word)
+
+        nextWords = replacements + adders + removers
+        # the result needs to be de-duped, as there is more than one way to reach the same next word.
+
+        return list(set(nextWords))
+
+    def findRemoverWords(self, word):
+        """
+        Find all valid words with one letter removed from word.
+        """
+        removers = list()
+
+        for position in range(len(word)):
+            potentialWord = word[0:position] + word[position+1:]
+
+            if self.isWord(potentialWord):
+                removers.append(potentialWord)
+
+        return removers
+
+    def findReplacementWords(self, word):
+        """
+        Find all valid words that are replacements of one letter in word
+        with any other letter.
+        """
+        replacements = list()
+
+        node = self.root
+        for position in range(len(word)):
+            suffix = word[position+1:]
+            for letter, child in node.edges():
+                if letter != word[position] and self.accepts(child, suffix):
+                    potentialWord = word[0:position] + letter + suffix
+                    if potentialWord not in self.removed:
+                        replacements.append(potentialWord)
+            node = node.child(word[position])
+            if node is None:
+                break
+
+        return replacements
+
+    def freeze(self):
+        self.frozen = True
+        return self
+
+    def isFrozen(self):
+        return self.frozen
+
+    def remove(self, word):
+        if self.frozen:
+            raise RuntimeError(f"remove({word}): dictionary is frozen")
+        word = word.lower()
+        if not self.isWord(word):
+            print (f"Error trying to remove {word} from dictionary")
+            return
+        self.removed.add(word)
+
+    def getSize(self):
+        return self.numWords - len(self.removed)
+
+    def getWordSet(self):
+        words = set()
+        self.collectWords(self.root, "", words)
+        return words - self.removed
+
+    def collectWords(self, node, prefix, words):
+        if node.final:
+            words.add(prefix)
+        for letter, child in node.edges():
+            self.collectWords(child, prefix + letter, words)
+
+    def getNumNodes(self):
+        seen = set()
+        pending = [self.root]
+        while pending:
+            node = pending.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            pending.extend(node.children)
+        return len(seen)
+
+    def isWord(self, word):
+        word = word.lower()
+        return word not in self.removed and self.accepts(self.root, word)
@@ -2,6 +2,16 @@ import sys
 
 
 class WordChainDict():
+    """
+    A dictionary is safe to share between threads as long as nothing modifies it.  Call
+    freeze() on a dictionary that will be shared; after that remove() raises instead of
+    mutating it.  Copies are never frozen, so Solver can still search a private copy.
+
+    Words can be added and removed in place.  Structures derived from a dictionary (e.g.
+    LetterMasks, SolutionCache) register with addListener() and are told about each change
+    through their wordAdded(word) and wordRemoved(word) methods, so they can update just
+    the entries the word affects.  Listeners are not copied by copy().
+    """
     Letters = [chr(l) for l in range(ord('a'), ord('z')+1)] 
 
     def __init__(self, wordList=None, maxLength=None):
@@ -18,16 +28,19 @@ class WordChainDict():
         if not maxLength:
             maxLength = 20
 
+        self.maxLength = maxLength
+        self.frozen = False
+        self.listeners = []
         self.wordSet = set()
         for word in wordList:
-            if word and word[0] != '#' and len(word) >= 3 and len(word) <= maxLength:
+            if self.isValidWord(word):
                 self.wordSet.add(word)
 
     def __str__(self):
         return str(list(self.wordSet)[0:20])
 
     def copy(self):
-        return WordChainDict(list(self.wordSet))
+        return WordChainDict(list(self.wordSet), self.maxLength)
 
     def findAdderWords(self, word):
         """
@@ -89,10 +102,41 @@ class WordChainDict():
             
         return replacements
 
+    def add(self, word):
+        if self.frozen:
+            raise RuntimeError(f"add({word}): dictionary is frozen")
+        word = word.lower()
+        if not self.isValidWord(word):
+            print (f"Error trying to add {word} to dictionary")
+            return
+        if word in self.wordSet:
+            return
+        self.wordSet.add(word)
+        for listener in self.listeners:
+            listener.wordAdded(word)
+
+    def addListener(self, listener):
+        self.listeners.append(listener)
+
+    def removeListener(self, listener):
+        self.listeners.remove(listener)
+
+    def freeze(self):
+        self.frozen = True
+        return self
+
+    def isFrozen(self):
+        return self.frozen
+
     def remove(self, word):
+        if self.frozen:
+            raise RuntimeError(f"remove({word}): dictionary is frozen")
+        word = word.lower()
         if (not word in self.wordSet):
             print (f"Error trying to remove {word} from dictionary")
         self.wordSet.remove(word)
+        for listener in self.listeners:
+            listener.wordRemoved(word)
 
     def getSize(self):
         return len(self.wordSet)
@@ -100,6 +144,10 @@ class WordChainDict():
     def getWordSet(self):
         return self.wordSet
 
+    # the rule for which lines of a word list become dictionary words
+    def isValidWord(self, word):
+        return word and word[0] != '#' and len(word) >= 3 and len(word) <= self.maxLength
+
     def isWord(self, word):
         return word.lower() in self.wordSet
 